@@ -1,16 +1,37 @@
+import array
 import dataclasses
 import decimal
 import fractions
+import functools
+import itertools
 import json
+import math
+import mmap
+import operator
+import os
 import pathlib
 import re
 import sys
-import xml.etree.ElementTree as et
 
-from typing import Dict, List, NamedTuple
+try:
+    from lxml import etree as et
+except ImportError:
+    import xml.etree.ElementTree as et  # type: ignore[no-redef]
 
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Tuple
 
-@dataclasses.dataclass
+# ElementPath expressions for the values read from FCP7XML <timecode/> elements.
+_TIMEBASE_PATH = "./rate/timebase"
+_NTSC_PATH = "./rate/ntsc"
+_DISPLAY_FORMAT_PATH = "./displayformat"
+_TIMECODE_STRING_PATH = "./string"
+_FRAME_PATH = "./frame"
+
+# _FILE_TIMECODE_PATH is the ElementPath of the <timecode/> in a <file/> element.
+_FILE_TIMECODE_PATH = "./timecode"
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
 class TimebaseInfo:
     """TimebaseInfo details the framerate/timebase of an event or object."""
 
@@ -27,74 +48,70 @@ class TimebaseInfo:
     # framerate is the frame rate at which the media is playing back.
     framerate: fractions.Fraction
 
+    # The fields below are derived from framerate once per timebase, rather than once
+    # per timecode.
+
+    # framerate_str is the string representation of framerate (ex: '24000/1001'). It
+    # is interned so every timebase with the same rate shares one string.
+    framerate_str: str = dataclasses.field(init=False)
+
+    # num_per_frame and den_per_frame are the numerator and denominator of the
+    # real-world seconds a single frame lasts (ex: 1001 and 24000 for 23.98).
+    num_per_frame: int = dataclasses.field(init=False)
+    den_per_frame: int = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        # The dataclass is frozen, so derived fields have to bypass __setattr__.
+        object.__setattr__(self, "framerate_str", sys.intern(str(self.framerate)))
+        object.__setattr__(self, "num_per_frame", self.framerate.denominator)
+        object.__setattr__(self, "den_per_frame", self.framerate.numerator)
+
     @classmethod
     def from_element(cls, elm: et.Element) -> "TimebaseInfo":
         """
-        from element parses a new TimebaseInfo instance from a FCP7XML <timecode/>
-        element.
+        from element parses a TimebaseInfo instance from a FCP7XML <timecode/>
+        element. Elements with the same rate and display format share an instance.
         """
-        timebase_elm = elm.find("./rate/timebase")
-        assert timebase_elm is not None
-        assert timebase_elm.text is not None
-        timebase = int(timebase_elm.text)
-
-        ntsc_elm = elm.find("./rate/ntsc")
-        assert ntsc_elm is not None
-        assert ntsc_elm.text is not None
-        ntsc = ntsc_elm.text == "TRUE"
-
-        drop_frame_elm = elm.find("./displayformat")
-        assert drop_frame_elm is not None
-        assert drop_frame_elm.text is not None
-        drop_frame = drop_frame_elm.text == "DF"
-
-        if ntsc:
-            frame_rate = fractions.Fraction(timebase * 1000, 1001)
-        else:
-            frame_rate = fractions.Fraction(timebase)
-
-        return TimebaseInfo(
-            timebase=timebase,
-            ntsc=ntsc,
-            drop_frame=drop_frame,
-            framerate=frame_rate,
-        )
+        timebase = _find_int(elm, _TIMEBASE_PATH)
 
+        ntsc_text = elm.findtext(_NTSC_PATH)
+        assert ntsc_text is not None
+        ntsc = ntsc_text == "TRUE"
 
-@dataclasses.dataclass
-class _TimecodeElementInfo:
-    """_TimecodeElementInfo is the parsed data from an FCP7XML <timecode/> element."""
+        drop_frame_text = elm.findtext(_DISPLAY_FORMAT_PATH)
+        assert drop_frame_text is not None
+        drop_frame = drop_frame_text == "DF"
 
-    # base is the timebase data.
-    base: TimebaseInfo
+        return _timebase_info(timebase, ntsc, drop_frame)
 
-    # timecode is the timecode string from the <string/> element.
-    timecode: str
 
-    # frame is the frame number from the <frame/> element.
-    frame: int
-
-    @classmethod
-    def from_element(cls, elm: et.Element) -> "_TimecodeElementInfo":
-        """
-        from_element parses a _TimecodeElementInfo instance from an FCP7XML
-        <timecode/> element.
-        """
-        timecode_text = elm.findtext("./string")
-        assert timecode_text is not None
+@functools.lru_cache(maxsize=16)
+def _timebase_info(timebase: int, ntsc: bool, drop_frame: bool) -> TimebaseInfo:
+    """
+    _timebase_info returns the TimebaseInfo for a timebase, memoized so that every
+    file and sequence at the same rate shares one instance and its derived fields.
+    """
+    return TimebaseInfo(
+        timebase=timebase,
+        ntsc=ntsc,
+        drop_frame=drop_frame,
+        framerate=_framerate(timebase, ntsc),
+    )
 
-        frame_text = elm.findtext("./frame")
-        assert frame_text is not None
-        frame = int(frame_text)
 
-        return cls(
-            base=TimebaseInfo.from_element(elm),
-            timecode=timecode_text,
-            frame=frame,
-        )
+@functools.lru_cache(maxsize=16)
+def _framerate(timebase: int, ntsc: bool) -> fractions.Fraction:
+    """
+    _framerate returns the playback frame rate for a timebase. There are only a handful
+    of timebase / ntsc combinations in use, so results are memoized and every
+    TimebaseInfo at the same rate shares a single Fraction.
+    """
+    if ntsc:
+        return fractions.Fraction(timebase * 1000, 1001)
+    return fractions.Fraction(timebase)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class TimecodeInfo:
     """TimecodeInfo holds all the timecode representations for a timecode event."""
 
@@ -139,8 +156,18 @@ class TimecodeInfo:
     @classmethod
     def from_element(cls, elm: et.Element) -> "TimecodeInfo":
         """from_element parses a TimecodeInfo from an FCP7XML <timecode/> element."""
-        xml_info = _TimecodeElementInfo.from_element(elm)
-        return cls._from_xml_info(xml_info)
+        timecode_text = elm.findtext(_TIMECODE_STRING_PATH)
+        assert timecode_text is not None
+
+        frame = _find_int(elm, _FRAME_PATH)
+
+        return cls.from_info(
+            timecode_text,
+            frame,
+            frames_raw=frame,
+            ppro_ticks_raw=-1,
+            timebase=TimebaseInfo.from_element(elm),
+        )
 
     @classmethod
     def from_info(
@@ -155,63 +182,114 @@ class TimecodeInfo:
         from_info returns a TimecodeInfo instance based on some parsed / processed info.
         All missing data will be derived.
         """
-        seconds_rational = frames / timebase.framerate
-        seconds_decimal = decimal.Decimal(seconds_rational.numerator) / decimal.Decimal(
-            seconds_rational.denominator
-        )
-
-        ppro_ticks = round(seconds_rational * 254016000000)
-
-        seconds = round(seconds_decimal, 9)
-        hours, seconds = divmod(seconds, 60 * 60)
-        minutes, seconds = divmod(seconds, 60)
-        seconds, fractal = divmod(seconds, 1)
-
-        if fractal == 0:
-            fractal_str = ""
-        else:
-            fractal_str = "." + str(fractal).split(".")[-1].rstrip("0")
-
-        runtime = (
-            f"{str(hours).zfill(2)}:{str(minutes).zfill(2)}:"
-            f"{str(seconds).zfill(2)}{fractal_str}"
+        (
+            seconds_rational,
+            seconds_decimal,
+            ppro_ticks,
+            feet_and_frames,
+            runtime,
+        ) = _derive_timecode_fields(
+            frames, (timebase.num_per_frame, timebase.den_per_frame)
         )
 
-        feet, feet_frames = divmod(frames, 16)
-        feet_and_frames = f"{feet}+{str(feet_frames).zfill(2)}"
-
         return cls(
             timebase=timebase.timebase,
             ntsc=timebase.ntsc,
             drop_frame=timebase.drop_frame,
-            frame_rate_frac=str(timebase.framerate),
+            frame_rate_frac=timebase.framerate_str,
             timecode=timecode,
             frame=frames,
             frame_xml_raw=frames_raw,
             ppro_ticks=ppro_ticks,
             ppro_ticks_xml_raw=ppro_ticks_raw,
-            seconds_rational=str(seconds_rational),
-            seconds_decimal=str(seconds_decimal),
+            seconds_rational=seconds_rational,
+            seconds_decimal=seconds_decimal,
             feet_and_frames=feet_and_frames,
             runtime=runtime,
         )
 
-    @classmethod
-    def _from_xml_info(cls, elm_info: _TimecodeElementInfo) -> "TimecodeInfo":
-        """
-        _from_xml_info returns a TimecodeInfo instance from a _TimecodeElementInfo
-        instance.
-        """
-        return cls.from_info(
-            elm_info.timecode,
-            elm_info.frame,
-            frames_raw=elm_info.frame,
-            ppro_ticks_raw=-1,
-            timebase=elm_info.base,
-        )
+
+@functools.lru_cache(maxsize=4096)
+def _derive_timecode_fields(
+    frames: int, seconds_per_frame: Tuple[int, int]
+) -> Tuple[str, str, int, str, str]:
+    """
+    _derive_timecode_fields derives the seconds_rational, seconds_decimal, ppro_ticks,
+    feet_and_frames and runtime values of a TimecodeInfo for a frame count at a
+    (num_per_frame, den_per_frame) seconds-per-frame rational.
+
+    All math is done on plain integers, except for seconds_decimal, which divides the
+    reduced rational with the decimal module. Results are memoized: adjacent events
+    share their record boundaries, so the record_out of every event is a cache hit when
+    it comes back around as the record_in of the next.
+    """
+    num_per_frame, den_per_frame = seconds_per_frame
+
+    seconds_num = frames * num_per_frame
+    seconds_den = den_per_frame
+    divisor = math.gcd(seconds_num, seconds_den)
+    seconds_num //= divisor
+    seconds_den //= divisor
+
+    if seconds_den == 1:
+        seconds_rational = str(seconds_num)
+    else:
+        seconds_rational = f"{seconds_num}/{seconds_den}"
+
+    ppro_ticks = _round_half_even(seconds_num * 254016000000, seconds_den)
+
+    hours, minutes, seconds, fractal = _split_runtime(seconds_num, seconds_den)
+
+    runtime = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    if fractal != 0:
+        runtime += f".{fractal:09d}".rstrip("0")
+
+    feet, feet_frames = divmod(frames, 16)
+    feet_and_frames = f"{feet}+{feet_frames:02d}"
+
+    seconds_decimal = str(decimal.Decimal(seconds_num) / decimal.Decimal(seconds_den))
+
+    return (
+        seconds_rational,
+        seconds_decimal,
+        ppro_ticks,
+        feet_and_frames,
+        runtime,
+    )
+
+
+# Nanosecond counts of the units a runtime value is split into.
+_NS_PER_SEC = 1_000_000_000
+_NS_PER_MIN = 60 * _NS_PER_SEC
+_NS_PER_HOUR = 60 * _NS_PER_MIN
+
+
+def _split_runtime(seconds_num: int, seconds_den: int) -> Tuple[int, int, int, int]:
+    """
+    _split_runtime splits a seconds_num / seconds_den interval into hours, minutes,
+    seconds and nanoseconds, rounding half-even to the nearest nanosecond. It is the
+    integer-only core of the runtime value; formatting is left to the caller.
+    """
+    total_ns = _round_half_even(seconds_num * _NS_PER_SEC, seconds_den)
+    hours, remainder = divmod(total_ns, _NS_PER_HOUR)
+    minutes, remainder = divmod(remainder, _NS_PER_MIN)
+    seconds, fractal = divmod(remainder, _NS_PER_SEC)
+    return hours, minutes, seconds, fractal
+
+
+def _round_half_even(num: int, den: int) -> int:
+    """
+    _round_half_even returns num / den rounded to the nearest integer, with ties going
+    to the even integer, the same way round() does for a Fraction or Decimal.
+    """
+    quotient, remainder = divmod(num, den)
+    doubled = remainder * 2
+    if doubled > den or (doubled == den and quotient % 2):
+        quotient += 1
+    return quotient
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class EventInfo:
     """EventInfo holds the data for a timeline event."""
 
@@ -231,7 +309,7 @@ class EventInfo:
     record_out: TimecodeInfo
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True, frozen=True)
 class SequenceInfo:
     """
     SequenceInfo contains information about a sequence of timecode events from an NLE
@@ -246,16 +324,60 @@ class SequenceInfo:
     events: List[EventInfo]
 
 
-def parse_sequence_info(root: et.ElementTree) -> SequenceInfo:
-    """parse_sequence_info parses SequenceInfo from an FCP7XML."""
+# _DURATION_PATH is the tag path of the sequence <duration/> in an FCP7XML.
+_DURATION_PATH = ("xmeml", "sequence", "duration")
+
+# _START_TIME_PATH is the tag path of the sequence <timecode/> in an FCP7XML.
+_START_TIME_PATH = ("xmeml", "sequence", "timecode")
+
+# _CLIPITEM_PATH is the tag path of video track <clipitem/> elements in an FCP7XML.
+_CLIPITEM_PATH = ("xmeml", "sequence", "media", "video", "track", "clipitem")
+
+# _clipitem_int_children fetches the children of a <clipitem/> holding the integer
+# values we read, from a tag -> element mapping, in a single call.
+_clipitem_int_children = operator.itemgetter(
+    "in", "out", "start", "end", "pproTicksIn", "pproTicksOut"
+)
+
+
+# _XML_PATHS are all the tag paths parse_xml reads from an FCP7XML.
+_XML_PATHS = frozenset((_DURATION_PATH, _START_TIME_PATH, _CLIPITEM_PATH))
+
+
+# ClipitemValues is the data read from a video track <clipitem/>: the timebase and
+# start frame of its source file, followed by its in, out, start, end, pproTicksIn and
+# pproTicksOut values.
+ClipitemValues = Tuple[TimebaseInfo, int, int, int, int, int, int, int]
+
+
+def parse_xml(xml_path: pathlib.Path) -> Tuple[SequenceInfo, List[ClipitemValues]]:
+    """
+    parse_xml parses SequenceInfo and the values of every video track <clipitem/> from
+    an FCP7XML in a single streaming pass, without holding the document in memory.
+
+    The sequence <timecode/> comes after all of the sequence's media, so clipitems are
+    reduced to their ClipitemValues as they are parsed, to be combined with the sequence
+    start time once it is known.
+    """
+    total_duration_frames_text = None
+    start_time_info = None
+    clipitems: List[ClipitemValues] = list()
+
+    # file_bases maps file ids to the (timebase, start frame) of the file.
+    file_bases: Dict[str, Tuple[TimebaseInfo, int]] = dict()
+
+    for path, elm in _stream_elements(xml_path, _XML_PATHS):
+        if path == _CLIPITEM_PATH:
+            clipitems.append(_clipitem_values(elm, file_bases))
+        elif path == _DURATION_PATH:
+            total_duration_frames_text = elm.text
+        else:
+            start_time_info = TimecodeInfo.from_element(elm)
 
-    total_duration_frames_text = root.findtext("./sequence/duration")
     assert total_duration_frames_text is not None
     print("TOTAL DURATION:", total_duration_frames_text)
 
-    start_time_elm = root.find("./sequence/timecode")
-    assert start_time_elm is not None
-    start_time_info = TimecodeInfo.from_element(start_time_elm)
+    assert start_time_info is not None
 
     seq_info = SequenceInfo(
         start_time=start_time_info,
@@ -263,23 +385,136 @@ def parse_sequence_info(root: et.ElementTree) -> SequenceInfo:
         events=list(),
     )
 
-    return seq_info
+    return seq_info, clipitems
+
+
+def _clipitem_values(
+    elm: et.Element, file_bases: Dict[str, Tuple[TimebaseInfo, int]]
+) -> ClipitemValues:
+    """
+    _clipitem_values reads the ClipitemValues of a video track <clipitem/>. The source
+    file's timebase is cached in file_bases by file id, as later clipitems from the same
+    file only reference it by id.
+    """
+    # Index the direct children once rather than re-walking the <clipitem/> for every
+    # value we need.
+    children = {child.tag: child for child in elm}
+
+    file_elm = children["file"]
+
+    file_id = file_elm.attrib["id"]
+
+    try:
+        file_base, file_start_frame = file_bases[file_id]
+    except KeyError:
+        base_elm = file_elm.find(_FILE_TIMECODE_PATH)
+        assert base_elm is not None
+        file_base = TimebaseInfo.from_element(base_elm)
+        file_start_frame = _find_int(base_elm, _FRAME_PATH)
+
+        file_bases[file_id] = (file_base, file_start_frame)
+
+    (
+        source_in_frames_raw,
+        source_out_frames_raw,
+        record_in_frames_raw,
+        record_out_frames_raw,
+        source_in_ppro_ticks_raw,
+        source_out_ppro_ticks_raw,
+    ) = _element_ints(_clipitem_int_children(children))
+
+    return (
+        file_base,
+        file_start_frame,
+        source_in_frames_raw,
+        source_out_frames_raw,
+        record_in_frames_raw,
+        record_out_frames_raw,
+        source_in_ppro_ticks_raw,
+        source_out_ppro_ticks_raw,
+    )
+
+
+def _stream_elements(
+    xml_path: pathlib.Path, paths: Collection[Tuple[str, ...]]
+) -> Iterator[Tuple[Tuple[str, ...], et.Element]]:
+    """
+    _stream_elements incrementally parses an xml document, yielding a
+    (tag path, element) pair for each element whose tag path from the root is in paths
+    as soon as the element has been fully parsed.
+
+    Yielded elements, and any element that is neither an ancestor nor a descendant of
+    a path, are cleared and detached from their parent once they have been handled.
+
+    Tag names alone are ambiguous in an FCP7XML (every <file/> has its own <timecode/>
+    and <media><video/>), so this listens for start events as well as end events to
+    know each element's path. That makes it somewhat slower than parsing the whole
+    tree in one call, in exchange for memory that no longer grows with the document.
+    """
+    ancestor_paths = {path[:i] for path in paths for i in range(1, len(path))}
+
+    # open_paths holds the tag path of each open element that is the root or a child
+    # of an ancestor path. Everything deeper is None: it is handled along with the
+    # wanted or discarded element it sits under, so its own path never matters.
+    open_paths: List[Optional[Tuple[str, ...]]] = []
+    parents: List[et.Element] = []
+
+    for event, elm in et.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            parent_path = open_paths[-1] if open_paths else ()
+            if parent_path is not None and (
+                not parent_path or parent_path in ancestor_paths
+            ):
+                open_paths.append(parent_path + (elm.tag,))
+            else:
+                open_paths.append(None)
+            parents.append(elm)
+            continue
+
+        path = open_paths.pop()
+        parents.pop()
+
+        if path is None or path in ancestor_paths:
+            continue
+        if path in paths:
+            yield path, elm
+
+        elm.clear()
+        if parents:
+            parents[-1].remove(elm)
 
 
 # event_regex is the regex or parsing an event from a CMX3600 EDL. It only captures
 # event timecodes, not event numbers or any special properties like markers or respeeds.
+# The timecode fields themselves are never read individually, so they are left
+# non-capturing to keep the match state small.
 event_regex = re.compile(
-    r"(?P<source_in>([0-9]{2}):([0-9]{2}):([0-9]{2}):([0-9]{2}))\s+"
-    r"(?P<source_out>([0-9]{2}):([0-9]{2}):([0-9]{2}):([0-9]{2}))\s+"
-    r"(?P<record_in>([0-9]{2}):([0-9]{2}):([0-9]{2}):([0-9]{2}))\s+"
-    r"(?P<record_out>([0-9]{2}):([0-9]{2}):([0-9]{2}):([0-9]{2}))",
+    rb"(?P<source_in>(?:[0-9]{2}:){3}[0-9]{2})\s+"
+    rb"(?P<source_out>(?:[0-9]{2}:){3}[0-9]{2})\s+"
+    rb"(?P<record_in>(?:[0-9]{2}:){3}[0-9]{2})\s+"
+    rb"(?P<record_out>(?:[0-9]{2}:){3}[0-9]{2})",
 )
 
 
-def event_list_from_edl(edl_path: pathlib.Path) -> List[re.Match]:
-    """event_list_from_edl generates a list of event_regex matches from a CMX3600 EDL"""
-    with edl_path.open("r") as f:
-        return [x for x in event_regex.finditer(f.read())]
+# EdlEvent is the (source_in, source_out, record_in, record_out) timecodes of an EDL
+# event, as the raw ASCII bytes matched by event_regex.
+EdlEvent = Tuple[bytes, bytes, bytes, bytes]
+
+
+def event_list_from_edl(edl_path: pathlib.Path) -> Iterator[EdlEvent]:
+    """
+    event_list_from_edl lazily yields the timecodes of each event_regex match in a
+    CMX3600 EDL. The EDL is memory-mapped rather than read into memory. Only the
+    matched groups are yielded, so no re.Match objects outlive the scan, and the mapping
+    is closed as soon as the iterator is exhausted.
+    """
+    with edl_path.open("rb") as f:
+        # An empty file cannot be memory-mapped, and has no events to yield.
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as edl_map:
+            yield from map(re.Match.groups, event_regex.finditer(edl_map))
 
 
 def write_out(xml_path: pathlib.Path, info: SequenceInfo) -> None:
@@ -294,67 +529,139 @@ def write_out(xml_path: pathlib.Path, info: SequenceInfo) -> None:
 
     print(f"WRITING JSON TO: '{out_file}'")
 
-    with out_file.open("w") as f:
-        json.dump(dataclasses.asdict(info), f, indent=4)
+    # Encode the whole document up front and write it in one call; json.dump() would
+    # issue a write for every token the encoder produces.
+    data = json.dumps(info, indent=4, default=_json_default)
+    out_file.write_bytes(data.encode("ascii"))
 
 
-def collect_event_info(
-    edl_events: List[re.Match],
-    xml_events: List[et.Element],
-    start_frame: int,
-) -> List[EventInfo]:
+def _json_default(obj: Any) -> Dict[str, Any]:
     """
-    collect_event_info combines the events from a list of EDL regex matches and FCP7XML
-    <clipitem/> elements in order to have a more complete set of timecode
-    representations generated from an outside program.
+    _json_default is the json.dump default hook for our dataclasses. It returns a
+    shallow field dict for the encoder to walk, rather than having
+    dataclasses.asdict() deep-copy the whole sequence up front.
     """
+    if not dataclasses.is_dataclass(obj) or isinstance(obj, type):
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-    class FileInfo(NamedTuple):
-        base: TimebaseInfo
-        start_frame: int
-
-    event_bases: Dict[str, FileInfo] = dict()
-    events: List[EventInfo] = list()
-
-    for edl_event, xml_event in zip(edl_events, xml_events):
-        file_elm = xml_event.find("./file")
-        assert file_elm is not None
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
 
-        file_id = file_elm.attrib["id"]
 
-        try:
-            file_info = event_bases[file_id]
-        except KeyError:
-            base_elm = xml_event.find("./file/timecode")
-            assert base_elm is not None
-            base_info = TimebaseInfo.from_element(base_elm)
-            file_start_frame = _find_int(base_elm, "./frame")
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """
+    _field_names returns the field names of a dataclass type in declaration order.
+    dataclasses.fields() rebuilds this list on every call, so it is memoized per type.
+    """
+    return tuple(field.name for field in dataclasses.fields(cls))
 
-            file_info = FileInfo(base=base_info, start_frame=file_start_frame)
-            event_bases[file_id] = file_info
 
-        source_in_frames_raw = _find_int(xml_event, "in")
-        source_in_frames = source_in_frames_raw + file_info.start_frame
+def collect_event_info(
+    edl_events: Iterator[EdlEvent],
+    xml_events: Iterable[ClipitemValues],
+    start_time: TimecodeInfo,
+) -> List[EventInfo]:
+    """
+    collect_event_info combines the events from EDL event timecodes and FCP7XML
+    <clipitem/> values in order to have a more complete set of timecode
+    representations generated from an outside program.
 
-        source_out_frames_raw = _find_int(xml_event, "out")
-        source_out_frames = source_out_frames_raw + file_info.start_frame
+    The EDL events are consumed lazily, in lockstep with the clipitem values. Raises
+    RuntimeError if they do not contain the same number of events, or if an event's
+    timecodes do not line up with its clipitem.
+    """
+    start_frame = start_time.frame
+    events: List[EventInfo] = list()
 
-        record_in_frames_raw = _find_int(xml_event, "start")
+    edl_event_count = 0
+    xml_event_count = 0
+
+    # Record and source durations of each event, checked against each other in a
+    # single comparison once all events are collected.
+    record_durations = array.array("q")
+    source_durations = array.array("q")
+
+    for xml_event, edl_event in itertools.zip_longest(xml_events, edl_events):
+        # Once one of the cutlists runs out, keep going only to count the other.
+        if xml_event is None or edl_event is None:
+            xml_event_count += xml_event is not None
+            edl_event_count += edl_event is not None
+            continue
+
+        xml_event_count += 1
+        edl_event_count += 1
+
+        (
+            file_base,
+            file_start_frame,
+            source_in_frames_raw,
+            source_out_frames_raw,
+            record_in_frames_raw,
+            record_out_frames_raw,
+            source_in_ppro_ticks_raw,
+            source_out_ppro_ticks_raw,
+        ) = xml_event
+
+        source_in_frames = source_in_frames_raw + file_start_frame
+        source_out_frames = source_out_frames_raw + file_start_frame
         record_in_frames = record_in_frames_raw + start_frame
-
-        record_out_frames_raw = _find_int(xml_event, "end")
         record_out_frames = record_out_frames_raw + start_frame
 
-        source_in_tc = edl_event.group("source_in")
-        source_out_tc = edl_event.group("source_out")
-        record_in_tc = edl_event.group("record_in")
-        record_out_tc = edl_event.group("record_out")
+        (
+            source_in_tc_bytes,
+            source_out_tc_bytes,
+            record_in_tc_bytes,
+            record_out_tc_bytes,
+        ) = edl_event
+
+        # Make sure the EDL event lines up with the XML event. Source timecodes are
+        # in the rate of the source file, record timecodes in the rate of the
+        # sequence. Drop-frame timecode skips frame numbers, so it cannot be checked
+        # with a plain conversion.
+        if not file_base.drop_frame:
+            timebase = file_base.timebase
+            _check_timecode_frames(
+                xml_event_count,
+                "source in",
+                source_in_tc_bytes,
+                timebase,
+                source_in_frames,
+            )
+            _check_timecode_frames(
+                xml_event_count,
+                "source out",
+                source_out_tc_bytes,
+                timebase,
+                source_out_frames,
+            )
+
+        if not start_time.drop_frame:
+            timebase = start_time.timebase
+            _check_timecode_frames(
+                xml_event_count,
+                "record in",
+                record_in_tc_bytes,
+                timebase,
+                record_in_frames,
+            )
+            _check_timecode_frames(
+                xml_event_count,
+                "record out",
+                record_out_tc_bytes,
+                timebase,
+                record_out_frames,
+            )
 
-        source_in_ppro_ticks_raw = _find_int(xml_event, "pproTicksIn")
-        source_out_ppro_ticks_raw = _find_int(xml_event, "pproTicksOut")
+        # Timecodes repeat across events (record_out of one event is the record_in of
+        # the next), so intern them rather than holding a copy per TimecodeInfo.
+        source_in_tc = sys.intern(source_in_tc_bytes.decode("ascii"))
+        source_out_tc = sys.intern(source_out_tc_bytes.decode("ascii"))
+        record_in_tc = sys.intern(record_in_tc_bytes.decode("ascii"))
+        record_out_tc = sys.intern(record_out_tc_bytes.decode("ascii"))
 
         duration = record_out_frames - record_in_frames
-        assert duration == source_out_frames - source_in_frames
+        record_durations.append(duration)
+        source_durations.append(source_out_frames - source_in_frames)
 
         event_info = EventInfo(
             duration_frames=duration,
@@ -363,36 +670,85 @@ def collect_event_info(
                 source_in_frames,
                 source_in_frames_raw,
                 source_in_ppro_ticks_raw,
-                file_info.base,
+                file_base,
             ),
             source_out=TimecodeInfo.from_info(
                 source_out_tc,
                 source_out_frames,
                 source_out_frames_raw,
                 source_out_ppro_ticks_raw,
-                file_info.base,
+                file_base,
             ),
             record_in=TimecodeInfo.from_info(
                 record_in_tc,
                 record_in_frames,
                 record_in_frames_raw,
                 -1,
-                file_info.base,
+                file_base,
             ),
             record_out=TimecodeInfo.from_info(
                 record_out_tc,
                 record_out_frames,
                 record_out_frames_raw,
                 -1,
-                file_info.base,
+                file_base,
             ),
         )
 
         events.append(event_info)
 
+    assert record_durations == source_durations
+
+    # Assert that we got the same number of elements from each cutlist.
+    if edl_event_count != xml_event_count:
+        raise RuntimeError(
+            f"event count from EDL ({edl_event_count}) "
+            f"and XML ({xml_event_count}) do not match",
+        )
+
     return events
 
 
+def _timecode_frames(timecode: bytes, timebase: int) -> int:
+    """
+    _timecode_frames converts a fixed-width, non-drop-frame 'HH:MM:SS:FF' timecode
+    matched by event_regex into a frame count at timebase. Digits are read directly
+    off of the ASCII bytes rather than splitting and converting each field with int().
+    """
+    hours = (timecode[0] - 48) * 10 + timecode[1] - 48
+    minutes = (timecode[3] - 48) * 10 + timecode[4] - 48
+    seconds = (timecode[6] - 48) * 10 + timecode[7] - 48
+    frames = (timecode[9] - 48) * 10 + timecode[10] - 48
+    return ((hours * 60 + minutes) * 60 + seconds) * timebase + frames
+
+
+def _check_timecode_frames(
+    event_number: int, name: str, timecode: bytes, timebase: int, frames: int
+) -> None:
+    """
+    _check_timecode_frames raises a RuntimeError if a non-drop-frame EDL timecode at
+    timebase does not land on the frame count read from the FCP7XML for the same event.
+    """
+    edl_frames = _timecode_frames(timecode, timebase)
+    if edl_frames != frames:
+        raise RuntimeError(
+            f"event {event_number} {name} from EDL ({timecode.decode('ascii')}, frame "
+            f"{edl_frames}) and XML (frame {frames}) do not match",
+        )
+
+
+def _element_ints(elms: Iterable[et.Element]) -> List[int]:
+    """
+    _element_ints converts the text values of elms into ints, or raises if an element
+    has no text or its text cannot be converted into an int.
+    """
+    ints = list()
+    for elm in elms:
+        assert elm.text is not None
+        ints.append(int(elm.text))
+    return ints
+
+
 def _find_int(elm: et.Element, path: str) -> int:
     """
     _find_int find an integer value from an xml element at path, or raises if the path
@@ -413,30 +769,18 @@ def main() -> None:
     source_xml = pathlib.Path(sys.argv[1])
     source_edl = pathlib.Path(sys.argv[2])
 
-    # Parse the xml into some high-level sequence information.
-    xml_tree = et.parse(source_xml)
-    info = parse_sequence_info(xml_tree)
+    # Parse the xml into some high-level sequence information and the values of each
+    # <clipitem/> element.
+    info, xml_events = parse_xml(source_xml)
 
-    # get a list of regex matches from a our CMX3600 EDL.
+    # get a lazy iterator of event timecodes from a our CMX3600 EDL.
     edl_events = event_list_from_edl(source_edl)
-    # get a list of <clipitem/> elements from our FCP7XML.
-    xml_events = xml_tree.findall("./sequence/media/video/track/clipitem")
-
-    # Assert that we got the same number of elements from each cutlist.
-    edl_event_count = len(edl_events)
-    xml_event_count = len(xml_events)
-    if edl_event_count != xml_event_count:
-        raise RuntimeError(
-            f"event count from EDL ({edl_event_count}) "
-            f"and XML ({xml_event_count}) do not match",
-        )
 
-    print("EVENTS FOUND:", len(edl_events))
+    events = collect_event_info(edl_events, xml_events, info.start_time)
 
-    events = collect_event_info(edl_events, xml_events, info.start_time.frame)
-    assert len(events) == len(edl_events)
+    print("EVENTS FOUND:", len(events))
 
-    info.events = events
+    info = dataclasses.replace(info, events=events)
 
     write_out(source_xml, info)
 